@@ -8,6 +8,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Filenames with common document extensions, compiled once at import
+FILE_MENTION_PATTERN = re.compile(r'\b\w+\.(?:pdf|docx?|xlsx?|txt|csv)\b', re.IGNORECASE)
+
 
 class IntentDetector:
     """Detects user intent from natural language queries."""
@@ -226,18 +229,7 @@ class IntentDetector:
     
     def _mentions_specific_file(self, text: str) -> bool:
         """Check if text mentions a specific filename."""
-        # Look for common file extensions
-        file_patterns = [
-            r'\b\w+\.pdf\b',
-            r'\b\w+\.docx?\b',
-            r'\b\w+\.xlsx?\b',
-            r'\b\w+\.txt\b',
-            r'\b\w+\.csv\b'
-        ]
-        for pattern in file_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return FILE_MENTION_PATTERN.search(text) is not None
 
 
 # Singleton instance
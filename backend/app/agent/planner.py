@@ -57,6 +57,40 @@ class Planner:
     Uses LLM to break down user objectives into actionable subtasks.
     """
     
+    # Keyword tables for intent detection (built once, shared by all calls)
+    SEND_VERBS = ("enviar", "envia", "envía", "mandar", "manda", "send")
+    EMAIL_WORDS = ("correo", "email", "mensaje", "mail")
+    # Pattern: "correo a Ana", "email a Juan", "mensaje a María"
+    EMAIL_RECIPIENT_PATTERNS = (
+        "correo a ", "correo para ", "email a ", "email para ",
+        "mensaje a ", "mensaje para ", "mail a ", "mail para "
+    )
+    CALENDAR_KEYWORDS = (
+        "evento", "eventos", "calendario", "calendar", "agenda", "reunión", "reuniones",
+        "meeting", "cita", "appointment", "próximo", "próximos", "siguiente", "next",
+        "horario", "schedule", "cuándo tengo", "cuando tengo", "what's on my"
+    )
+    EMAIL_QUERY_KEYWORDS = (
+        "email", "correo", "correos", "mensaje", "mensajes", "inbox", "bandeja",
+        "mail", "gmail", "recibido", "enviado", "sent", "received"
+    )
+    DOCUMENT_WORDS = ("document", "archivo", "fichero", "file")
+    METADATA_KEYWORDS = (
+        "cuánt", "cuantos", "qué documentos", "que documentos", "dime que",
+        "qué archivos", "que archivos", "listar", "mostrar", "list"
+    )
+    # Shorter verb forms catch all conjugations: genera/generar, crea/crear, etc.
+    FILE_ACTIONS = (
+        "genera", "generar", "crea", "crear", "exporta", "exportar", "haz", "hacer",
+        "generate", "create", "export"
+    )
+    FILE_TYPES = ("pdf", "excel", "documento", "archivo", "reporte", "informe", "spreadsheet", "hoja")
+    INFO_QUERY_KEYWORDS = (
+        "qué", "que", "cuál", "cual", "cómo", "como", "quién", "quien", "dónde", "donde",
+        "cuándo", "cuando", "por qué", "porque", "dame", "dime", "explica", "muestra",
+        "what", "which", "how", "who", "where", "when", "why", "tell", "show", "explain"
+    )
+    
     def __init__(self, llm_client=None):
         """
         Initialize the planner.
@@ -89,40 +123,31 @@ class Planner:
         
         # PRIORITY 1: Email SEND operation (highest priority)
         # Detect explicit send verbs OR pattern "correo/email/mensaje a [nombre]"
-        has_send_verb = any(kw in obj_lower for kw in ["enviar", "envia", "envía", "mandar", "manda", "send"])
-        has_email_word = any(kw in obj_lower for kw in ["correo", "email", "mensaje", "mail"])
-        # Pattern: "correo a Ana", "email a Juan", "mensaje a María"
-        has_recipient_pattern = any(pattern in obj_lower for pattern in [
-            "correo a ", "correo para ", "email a ", "email para ",
-            "mensaje a ", "mensaje para ", "mail a ", "mail para "
-        ])
+        has_send_verb = self._contains_keywords(obj_lower, self.SEND_VERBS)
+        has_email_word = self._contains_keywords(obj_lower, self.EMAIL_WORDS)
+        has_recipient_pattern = self._contains_keywords(obj_lower, self.EMAIL_RECIPIENT_PATTERNS)
         
         is_email_send = (has_send_verb and has_email_word) or has_recipient_pattern
         
         # Calendar query: asking about events or schedule
-        is_calendar_query = any(kw in obj_lower for kw in [
-            "evento", "eventos", "calendario", "calendar", "agenda", "reunión", "reuniones",
-            "meeting", "cita", "appointment", "próximo", "próximos", "siguiente", "next",
-            "horario", "schedule", "cuándo tengo", "cuando tengo", "what's on my"
-        ]) and not is_email_send  # Don't override email send
+        is_calendar_query = (
+            not is_email_send  # Don't override email send
+            and self._contains_keywords(obj_lower, self.CALENDAR_KEYWORDS)
+        )
         
         # Email query: asking about messages, inbox, OR sending emails
-        is_email_query = any(kw in obj_lower for kw in [
-            "email", "correo", "correos", "mensaje", "mensajes", "inbox", "bandeja",
-            "mail", "gmail", "recibido", "enviado", "sent", "received"
-        ]) or is_email_send
+        is_email_query = is_email_send or self._contains_keywords(obj_lower, self.EMAIL_QUERY_KEYWORDS)
         
         # Metadata query: asking ABOUT documents (how many, which files, etc.)
-        is_metadata_query = False
-        if any(word in obj_lower for word in ["document", "archivo", "fichero", "file"]):
-            if any(kw in obj_lower for kw in ["cuánt", "cuantos", "qué documentos", "que documentos", "dime que", "qué archivos", "que archivos", "listar", "mostrar", "list"]):
-                is_metadata_query = True
+        is_metadata_query = (
+            self._contains_keywords(obj_lower, self.DOCUMENT_WORDS)
+            and self._contains_keywords(obj_lower, self.METADATA_KEYWORDS)
+        )
         
         # File generation: user wants to create/export something
         # Priority: if user explicitly mentions generating files, this takes precedence
-        # Use shorter verb forms to catch all conjugations: genera/generar, crea/crear, etc.
-        has_file_action = any(kw in obj_lower for kw in ["genera", "generar", "crea", "crear", "exporta", "exportar", "haz", "hacer", "generate", "create", "export"])
-        has_file_type = any(kw in obj_lower for kw in ["pdf", "excel", "documento", "archivo", "reporte", "informe", "spreadsheet", "hoja"])
+        has_file_action = self._contains_keywords(obj_lower, self.FILE_ACTIONS)
+        has_file_type = self._contains_keywords(obj_lower, self.FILE_TYPES)
         is_file_generation = has_file_action and has_file_type
         
         # Debug logging
@@ -136,12 +161,12 @@ class Planner:
         logger.info(f"   is_metadata_query: {is_metadata_query}")
         
         # Information query: user asking questions about content
-        # Only if NOT generating a file
-        is_info_query = any(kw in obj_lower for kw in [
-            "qué", "que", "cuál", "cual", "cómo", "como", "quién", "quien", "dónde", "donde",
-            "cuándo", "cuando", "por qué", "porque", "dame", "dime", "explica", "muestra",
-            "what", "which", "how", "who", "where", "when", "why", "tell", "show", "explain"
-        ]) and not is_metadata_query and not is_calendar_query and not is_email_query and not is_file_generation
+        # Only if NOT generating a file (cheap flags checked before the keyword scan)
+        is_info_query = (
+            not is_metadata_query and not is_calendar_query and not is_email_query
+            and not is_file_generation
+            and self._contains_keywords(obj_lower, self.INFO_QUERY_KEYWORDS)
+        )
         
         logger.info(f"   is_info_query: {is_info_query}")
         
@@ -273,6 +298,10 @@ class Planner:
         logger.info(f"Plan generated with {len(subtasks)} subtasks")
         return plan
     
+    def _contains_keywords(self, text: str, keywords) -> bool:
+        """Check if text contains any of the keywords."""
+        return any(kw in text for kw in keywords)
+    
     def _build_planner_prompt(
         self,
         objective: str,
@@ -15,6 +15,21 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Generated TTS audio is written to and served from here
+AUDIO_DIR = os.path.abspath(os.path.join("data", "audio"))
+
+# Whisper pulls in torch, so it is imported on first transcription only
+_whisper = None
+
+
+def _get_whisper():
+    """Import the Whisper module on first use and cache it."""
+    global _whisper
+    if _whisper is None:
+        import whisper
+        _whisper = whisper
+    return _whisper
+
 
 class TTSRequest(BaseModel):
     """Text-to-speech request model."""
@@ -70,7 +85,7 @@ async def transcribe_audio(file: UploadFile = File(...)):
         
         try:
             # Use Whisper for transcription
-            import whisper
+            whisper = _get_whisper()
             
             # Load model (base is a good balance between speed and accuracy)
             # Options: tiny, base, small, medium, large
@@ -131,7 +146,7 @@ async def synthesize_speech(request: TTSRequest):
             )
         
         # Create audio output directory
-        audio_dir = os.path.join(os.getcwd(), "data", "audio")
+        audio_dir = AUDIO_DIR
         os.makedirs(audio_dir, exist_ok=True)
         
         # Generate filename
@@ -247,8 +262,7 @@ async def get_audio_file(filename: str):
     """
     from fastapi.responses import FileResponse
     
-    audio_dir = os.path.join(os.getcwd(), "data", "audio")
-    file_path = os.path.join(audio_dir, filename)
+    file_path = os.path.join(AUDIO_DIR, filename)
     
     if not os.path.exists(file_path):
         raise HTTPException(
@@ -292,7 +306,7 @@ async def get_voice_status():
     }
     
     try:
-        import whisper
+        _get_whisper()
         status["whisper"] = True
     except ImportError:
         pass
@@ -3,6 +3,7 @@ File Writer Tool - Generate PDF and Excel files
 Creates formatted documents from structured data
 """
 from typing import Dict, Any, List, Optional
+import functools
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -11,6 +12,45 @@ import os
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_pdf_styles() -> Dict[str, Any]:
+    """
+    Build the PDF paragraph styles once and reuse them across documents.
+    
+    Returns:
+        Dict with 'title', 'body' and 'metadata' ParagraphStyle objects
+    """
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    
+    styles = getSampleStyleSheet()
+    return {
+        "title": ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor='#2C3E50',
+            spaceAfter=30,
+            alignment=TA_CENTER
+        ),
+        "body": ParagraphStyle(
+            'CustomBody',
+            parent=styles['BodyText'],
+            fontSize=12,
+            leading=16,
+            alignment=TA_JUSTIFY,
+            spaceAfter=12
+        ),
+        "metadata": ParagraphStyle(
+            'Metadata',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor='#7F8C8D',
+            spaceAfter=20
+        ),
+    }
+
+
 class FileWriterTool:
     """Tool for generating PDF and Excel files from structured data."""
     
@@ -46,10 +86,8 @@ class FileWriterTool:
         """
         try:
             from reportlab.lib.pagesizes import letter, A4
-            from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
             from reportlab.lib.units import inch
             from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
-            from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
         except ImportError:
             logger.error("reportlab not installed. Run: pip install reportlab")
             return {
@@ -80,26 +118,11 @@ class FileWriterTool:
             
             # Container for flowables
             story = []
-            styles = getSampleStyleSheet()
             
-            # Custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                textColor='#2C3E50',
-                spaceAfter=30,
-                alignment=TA_CENTER
-            )
-            
-            body_style = ParagraphStyle(
-                'CustomBody',
-                parent=styles['BodyText'],
-                fontSize=12,
-                leading=16,
-                alignment=TA_JUSTIFY,
-                spaceAfter=12
-            )
+            # Custom styles (built once per process)
+            pdf_styles = _get_pdf_styles()
+            title_style = pdf_styles["title"]
+            body_style = pdf_styles["body"]
             
             # Add title
             story.append(Paragraph(title, title_style))
@@ -107,13 +130,7 @@ class FileWriterTool:
             
             # Add metadata if provided
             if metadata:
-                meta_style = ParagraphStyle(
-                    'Metadata',
-                    parent=styles['Normal'],
-                    fontSize=10,
-                    textColor='#7F8C8D',
-                    spaceAfter=20
-                )
+                meta_style = pdf_styles["metadata"]
                 meta_text = " | ".join([f"<b>{k}:</b> {v}" for k, v in metadata.items()])
                 story.append(Paragraph(meta_text, meta_style))
                 story.append(Spacer(1, 0.3 * inch))
@@ -31,7 +31,7 @@ def get_ocr_tool() -> Callable[[str], dict]:
 OCR Tool - Extract text from images
 Supports multiple image formats with preprocessing for better accuracy
 """
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Union, BinaryIO
 import logging
 from pathlib import Path
 import os
@@ -55,7 +55,7 @@ class OCRTool:
     
     def extract_text_from_image(
         self,
-        image_path: str,
+        image_path: Union[str, Path, BinaryIO, 'Image'],
         preprocess: bool = True,
         config: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -63,7 +63,8 @@ class OCRTool:
         Extract text from an image file.
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, a file-like object with
+                encoded image bytes, or an already loaded PIL Image
             preprocess: Whether to apply preprocessing for better accuracy
             config: Custom Tesseract config string
             
@@ -81,14 +82,14 @@ class OCRTool:
             }
         
         try:
-            if not os.path.exists(image_path):
+            if isinstance(image_path, (str, Path)) and not os.path.exists(image_path):
                 return {
                     "status": "error",
                     "message": f"Image file not found: {image_path}"
                 }
             
             # Load image
-            image = Image.open(image_path)
+            image = self._load_image(image_path)
             
             # Preprocess if requested
             if preprocess:
@@ -131,6 +132,22 @@ class OCRTool:
                 "message": f"OCR failed: {str(e)}"
             }
     
+    def _load_image(self, source: Union[str, Path, BinaryIO, 'Image']) -> 'Image':
+        """
+        Load an image from a path or file-like object, or pass a PIL Image through.
+        
+        Args:
+            source: Image path, file-like object or PIL Image
+            
+        Returns:
+            PIL Image object
+        """
+        from PIL import Image
+        
+        if isinstance(source, Image.Image):
+            return source
+        return Image.open(source)
+    
     def _preprocess_image(self, image: 'Image') -> 'Image':
         """
         Preprocess image for better OCR accuracy.
@@ -218,14 +235,14 @@ class OCRTool:
     
     def extract_text_with_layout(
         self,
-        image_path: str,
+        image_path: Union[str, Path, BinaryIO, 'Image'],
         preprocess: bool = True
     ) -> Dict[str, Any]:
         """
         Extract text with layout information (bounding boxes, confidence per word).
         
         Args:
-            image_path: Path to the image file
+            image_path: Path to the image file, a file-like object or a PIL Image
             preprocess: Whether to preprocess the image
             
         Returns:
@@ -241,13 +258,13 @@ class OCRTool:
             }
         
         try:
-            if not os.path.exists(image_path):
+            if isinstance(image_path, (str, Path)) and not os.path.exists(image_path):
                 return {
                     "status": "error",
                     "message": f"Image file not found: {image_path}"
                 }
             
-            image = Image.open(image_path)
+            image = self._load_image(image_path)
             
             if preprocess:
                 image = self._preprocess_image(image)
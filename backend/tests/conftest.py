@@ -0,0 +1,159 @@
+"""
+Pytest configuration and shared fixtures for backend tests.
+"""
+import hashlib
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+# Cache key and inputs for --skip-unchanged-ocr (see pytest_collection_modifyitems)
+OCR_HASH_KEY = "servibot/ocr_src_hash"
+OCR_SOURCES = (
+    Path(__file__).parent.parent / "app" / "tools" / "ocr_tool.py",
+    Path(__file__).parent / "test_ocr_tool.py",
+)
+
+# Node ids of TestOCRTool tests that passed / failed in this session
+_ocr_results = {"passed": set(), "failed": set()}
+
+
+def pytest_addoption(parser):
+    """Register command-line options for the backend test suite."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Run tests marked as slow (full agent pipeline, LLM/embeddings)"
+    )
+    parser.addoption(
+        "--skip-unchanged-ocr",
+        action="store_true",
+        default=False,
+        help="Skip TestOCRTool tests that passed last run if the OCR sources are unchanged"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow tests unless --run-slow is given, and unchanged OCR tests on request."""
+    _skip_unchanged_ocr_tests(config, items)
+    
+    if config.getoption("--run-slow"):
+        return
+    
+    skip_slow = pytest.mark.skip(reason="use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def _ocr_sources_hash() -> str:
+    """SHA-256 over the OCR tool source and its test module."""
+    digest = hashlib.sha256()
+    for path in OCR_SOURCES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _is_cached_ocr_test(nodeid: str) -> bool:
+    """TestOCRTool tests eligible for skipping; init tests always run."""
+    return "test_ocr_tool.py::TestOCRTool::" in nodeid and "::test_initialization" not in nodeid
+
+
+def _skip_unchanged_ocr_tests(config, items):
+    """With --skip-unchanged-ocr, skip TestOCRTool tests that passed last time
+    if neither source changed since.
+    
+    Run with --cache-clear to force them.
+    """
+    cache = getattr(config, "cache", None)
+    if cache is None or not config.getoption("--skip-unchanged-ocr"):
+        return
+    cached = cache.get(OCR_HASH_KEY, {})
+    if cached.get("hash") != _ocr_sources_hash():
+        return
+    
+    passed = set(cached.get("passed", []))
+    skip_unchanged = pytest.mark.skip(reason="unchanged since last pass")
+    for item in items:
+        if item.nodeid in passed and _is_cached_ocr_test(item.nodeid):
+            item.add_marker(skip_unchanged)
+
+
+def pytest_runtest_logreport(report):
+    """Track TestOCRTool outcomes in this session."""
+    if not _is_cached_ocr_test(report.nodeid):
+        return
+    if report.failed:
+        _ocr_results["failed"].add(report.nodeid)
+    elif report.when == "call" and report.passed:
+        _ocr_results["passed"].add(report.nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Store which TestOCRTool tests passed against the current OCR sources hash."""
+    config = session.config
+    cache = getattr(config, "cache", None)
+    if hasattr(config, "workerinput") or cache is None:
+        return
+    
+    current = _ocr_sources_hash()
+    cached = cache.get(OCR_HASH_KEY, {})
+    passed = set(cached.get("passed", [])) if cached.get("hash") == current else set()
+    passed = (passed | _ocr_results["passed"]) - _ocr_results["failed"]
+    cache.set(OCR_HASH_KEY, {"hash": current, "passed": sorted(passed)})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _chroma_tmp(tmp_path_factory):
+    """Keep the ChromaDB persist directory under pytest's temp area.
+    
+    Tests never touch the developer's ./data/vector_db, and pointing
+    TMPDIR at a RAM-backed filesystem (e.g. /dev/shm on Linux CI) makes
+    persist/reset effectively free.
+    """
+    from app.core.config import settings
+    from app.db.chroma_client import reset_client
+    
+    persist_dir = tmp_path_factory.mktemp("chroma")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "VECTOR_DB_PATH", str(persist_dir))
+        reset_client()
+        yield persist_dir
+    reset_client()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _uploads_tmp(tmp_path_factory):
+    """Give each test session (and each xdist worker) its own uploads area.
+    
+    tmp_path_factory is already per-worker under pytest-xdist, so parallel
+    workers never share uploaded files or the upload status file.
+    """
+    from app.core.config import settings
+    import app.api.upload as upload_api
+    
+    uploads_dir = tmp_path_factory.mktemp("uploads")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "UPLOAD_DIR", str(uploads_dir))
+        mp.setattr(upload_api, "UPLOAD_STATUS_FILE", str(uploads_dir.parent / "upload_status.json"))
+        yield uploads_dir
+
+
+@pytest.fixture(scope="session")
+def app_client(_uploads_tmp, _chroma_tmp):
+    """Uncached test client for the FastAPI app, shared across the session.
+    
+    Entered as a context manager so lifespan startup/shutdown runs once per
+    session (after the temp upload and Chroma dirs are in place).
+    """
+    from app.main import app
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def client(app_client):
+    """Test client for the FastAPI app (the shared session client)."""
+    return app_client
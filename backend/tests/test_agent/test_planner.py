@@ -1,9 +1,23 @@
 """
 Tests for Agent Planner module
 """
+import functools
+
 import pytest
 from app.agent.planner import planner, Planner, ExecutionPlan, SubTask
 
+_LONG_MESSAGE = "Create a document " * 100
+
+# Schema check runs once at collection; per-task tests only validate types
+_SUBTASK_FIELDS = set(SubTask.model_fields)
+assert {"step", "action", "tool", "requires_confirmation"} <= _SUBTASK_FIELDS
+
+
+@pytest.fixture(scope="module")
+def cached_plan():
+    """Memoized planner: each distinct objective is planned once per module."""
+    return functools.lru_cache(maxsize=None)(planner.generate_plan)
+
 
 class TestPlannerBasic:
     """Basic tests for planner functionality."""
@@ -32,41 +46,21 @@ class TestPlannerBasic:
 class TestPlannerIntentDetection:
     """Tests for intent detection and tool selection."""
     
-    def test_file_generation_intent(self):
-        """Test detection of file generation intent."""
-        plan = planner.generate_plan("Generate a PDF report")
-        
-        # Should have file_writer tool in subtasks
-        tools_used = [task.tool for task in plan.subtasks]
-        assert "file_writer" in tools_used
-    
-    def test_note_creation_intent(self):
-        """Test detection of note creation intent."""
-        plan = planner.generate_plan("Create a note with the meeting summary")
-        
-        tools_used = [task.tool for task in plan.subtasks]
-        assert "notes" in tools_used or "file_writer" in tools_used
-    
-    def test_email_intent(self):
-        """Test detection of email sending intent."""
-        plan = planner.generate_plan("Send an email to the team")
-        
-        tools_used = [task.tool for task in plan.subtasks]
-        assert "email" in tools_used
-    
-    def test_calendar_intent(self):
-        """Test detection of calendar event intent."""
-        plan = planner.generate_plan("Schedule a meeting for tomorrow at 3pm")
-        
-        tools_used = [task.tool for task in plan.subtasks]
-        assert "calendar" in tools_used
-    
-    def test_ocr_intent(self):
-        """Test detection of OCR processing intent."""
-        plan = planner.generate_plan("Extract text from the uploaded image")
-        
-        tools_used = [task.tool for task in plan.subtasks]
-        assert "ocr" in tools_used
+    @pytest.mark.parametrize("message,expected", [
+        ("Generate a PDF report", "file_writer"),
+        ("Create a note with the meeting summary", {"notes", "file_writer"}),
+        ("Send an email to the team", "email"),
+        ("Schedule a meeting for tomorrow at 3pm", "calendar"),
+        ("Extract text from the uploaded image", "ocr"),
+    ])
+    def test_intent(self, message, expected, cached_plan):
+        """Test that each intent selects the expected tool (or one of a set)."""
+        tools_used = {task.tool for task in cached_plan(message).subtasks}
+        
+        if isinstance(expected, str):
+            assert expected in tools_used
+        else:
+            assert tools_used & expected
 
 
 class TestPlannerSubtaskStructure:
@@ -77,11 +71,6 @@ class TestPlannerSubtaskStructure:
         plan = planner.generate_plan("Create a document")
         
         for task in plan.subtasks:
-            assert hasattr(task, 'step')
-            assert hasattr(task, 'action')
-            assert hasattr(task, 'tool')
-            assert hasattr(task, 'requires_confirmation')
-            
             assert isinstance(task.step, int)
             assert isinstance(task.action, str)
             assert isinstance(task.tool, str)
@@ -136,10 +125,9 @@ class TestPlannerEdgeCases:
         # Should still return valid plan (maybe default/error handling)
         assert isinstance(plan, ExecutionPlan)
     
-    def test_very_long_message(self):
+    def test_very_long_message(self, cached_plan):
         """Test planner with very long message."""
-        long_message = "Create a document " * 100
-        plan = planner.generate_plan(long_message)
+        plan = cached_plan(_LONG_MESSAGE)
         
         assert isinstance(plan, ExecutionPlan)
         assert len(plan.subtasks) > 0
@@ -2,19 +2,86 @@
 Tests for Chat API endpoint
 """
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
+from app.agent.planner import planner, ExecutionPlan, SubTask
+from app.agent.executor import executor
+from app.agent.evaluator import evaluator
 
-client = TestClient(app)
 
+STUB_ACTION = "Stub action for API shape tests"
+STUB_EVALUATION = {"status": "success", "success_rate": 100.0, "summary": "Stub evaluation"}
 
+
+def _stub_plan(objective, context=None):
+    """Deterministic single-step plan used instead of the real planner."""
+    subtasks = [
+        SubTask(
+            step=1,
+            action=STUB_ACTION,
+            tool="notes",
+            requires_confirmation=False
+        )
+    ]
+    return ExecutionPlan(
+        objective=objective,
+        subtasks=subtasks,
+        total_estimated_time=1,
+        requires_user_confirmation=False
+    )
+
+
+async def _stub_execute_plan(plan, user_confirmations=None, context=None):
+    """Canned executor output: every step succeeds without running tools."""
+    return {
+        "results": [
+            {"step": s.step, "status": "success", "tool_used": s.tool, "result": None}
+            for s in plan.subtasks
+        ],
+        "total_steps": len(plan.subtasks),
+        "completed_steps": len(plan.subtasks),
+        "failed_steps": 0
+    }
+
+
+def _stub_evaluate_results(execution_results):
+    """Canned evaluator output."""
+    return dict(STUB_EVALUATION)
+
+
+@pytest.fixture(scope="class")
+def _fast_agents():
+    """Replace planner, executor and evaluator with stubs for shape-only tests.
+    
+    These tests only check the response schema, so no planning, tool
+    execution or LLM work is needed. The real path is covered by
+    TestChatIntegration (marked slow).
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(planner, "generate_plan", _stub_plan)
+        mp.setattr(executor, "execute_plan", _stub_execute_plan)
+        mp.setattr(evaluator, "evaluate_results", _stub_evaluate_results)
+        yield
+
+
+@pytest.fixture(scope="class")
+def seeded_conversation(app_client, _fast_agents):
+    """Run one agent pass and return its conversation ID for reuse."""
+    response = app_client.post(
+        "/api/chat",
+        json={"message": "Hola"}
+    )
+    
+    assert response.status_code == 200
+    return response.json()["conversation_id"]
+
+
+@pytest.mark.usefixtures("_fast_agents")
 class TestChatEndpoint:
     """Test suite for main chat endpoint."""
     
-    def test_chat_basic_message(self):
+    def test_chat_basic_message(self, client):
         """Test basic chat message processing."""
         response = client.post(
-            "/chat",
+            "/api/chat",
             json={"message": "Hola, ¿cómo estás?"}
         )
         
@@ -33,11 +100,15 @@ class TestChatEndpoint:
         assert isinstance(data["response"], str)
         assert isinstance(data["plan"], list)
         assert isinstance(data["execution"], dict)
+        
+        # Served by the stubbed agents
+        assert data["plan"][0]["action"] == STUB_ACTION
+        assert data["evaluation"] == STUB_EVALUATION
     
-    def test_chat_with_context(self):
+    def test_chat_with_context(self, client):
         """Test chat with additional context."""
         response = client.post(
-            "/chat",
+            "/api/chat",
             json={
                 "message": "Genera un informe",
                 "context": {"user_id": "test123"}
@@ -48,10 +119,10 @@ class TestChatEndpoint:
         data = response.json()
         assert "response" in data
     
-    def test_chat_file_generation_intent(self):
+    def test_chat_file_generation_intent(self, client):
         """Test chat with file generation intent (PDF/Excel)."""
         response = client.post(
-            "/chat",
+            "/api/chat",
             json={"message": "Genera un PDF con la información"}
         )
         
@@ -65,10 +136,10 @@ class TestChatEndpoint:
         if "generated_file" in data and data["generated_file"]:
             assert "path" in data["generated_file"] or "filename" in data["generated_file"]
     
-    def test_chat_rag_query_intent(self):
+    def test_chat_rag_query_intent(self, client):
         """Test chat that should trigger RAG search."""
         response = client.post(
-            "/chat",
+            "/api/chat",
             json={"message": "¿Qué información tienes sobre ServiBot?"}
         )
         
@@ -80,10 +151,10 @@ class TestChatEndpoint:
         # sources can be None, empty list, or populated list
         assert data["sources"] is None or isinstance(data["sources"], list)
     
-    def test_chat_document_listing_intent(self):
+    def test_chat_document_listing_intent(self, client):
         """Test chat asking about uploaded documents."""
         response = client.post(
-            "/chat",
+            "/api/chat",
             json={"message": "¿Qué documentos tengo subidos?"}
         )
         
@@ -96,10 +167,10 @@ class TestChatEndpoint:
         # Response should mention documents or files
         assert any(word in data["response"].lower() for word in ["documento", "archivo", "fichero"])
     
-    def test_chat_empty_message(self):
+    def test_chat_empty_message(self, client):
         """Test chat with empty message."""
         response = client.post(
-            "/chat",
+            "/api/chat",
             json={"message": ""}
         )
         
@@ -107,38 +178,29 @@ class TestChatEndpoint:
         # Either accept and return generic response or reject with 400
         assert response.status_code in [200, 400]
     
-    def test_chat_conversation_id_persistence(self):
+    def test_chat_conversation_id_persistence(self, client, seeded_conversation):
         """Test conversation ID persistence across messages."""
-        # First message
-        response1 = client.post(
-            "/chat",
-            json={"message": "Hola"}
-        )
-        
-        assert response1.status_code == 200
-        conv_id = response1.json()["conversation_id"]
-        
-        # Second message with same conversation ID
-        response2 = client.post(
-            "/chat",
+        response = client.post(
+            "/api/chat",
             json={
                 "message": "¿Cómo estás?",
-                "conversation_id": conv_id
+                "conversation_id": seeded_conversation
             }
         )
         
-        assert response2.status_code == 200
+        assert response.status_code == 200
         # Should maintain conversation ID
-        assert response2.json()["conversation_id"] == conv_id
+        assert response.json()["conversation_id"] == seeded_conversation
 
 
+@pytest.mark.usefixtures("_fast_agents")
 class TestChatAgentFlow:
     """Test suite for agent flow within chat."""
     
-    def test_planner_execution(self):
+    def test_planner_execution(self, client):
         """Test that planner generates valid plans."""
         response = client.post(
-            "/chat",
+            "/api/chat",
             json={"message": "Crea una nota sobre ServiBot"}
         )
         
@@ -154,11 +216,14 @@ class TestChatAgentFlow:
             assert "step" in subtask
             assert "action" in subtask
             assert "tool" in subtask
+        
+        # The stub planner produced exactly one notes step
+        assert [(s["step"], s["action"], s["tool"]) for s in data["plan"]] == [(1, STUB_ACTION, "notes")]
     
-    def test_executor_results(self):
+    def test_executor_results(self, client):
         """Test that executor returns results."""
         response = client.post(
-            "/chat",
+            "/api/chat",
             json={"message": "Realiza una búsqueda"}
         )
         
@@ -174,11 +239,15 @@ class TestChatAgentFlow:
         for result in data["execution"]["results"]:
             assert "status" in result
             assert result["status"] in ["success", "failed", "pending", "skipped"]
+        
+        # The stub executor marked its single step successful
+        assert data["execution"]["completed_steps"] == 1
+        assert data["execution"]["results"][0]["tool_used"] == "notes"
     
-    def test_evaluator_assessment(self):
+    def test_evaluator_assessment(self, client):
         """Test that evaluator provides assessment."""
         response = client.post(
-            "/chat",
+            "/api/chat",
             json={"message": "Test task"}
         )
         
@@ -189,6 +258,28 @@ class TestChatAgentFlow:
         assert data["evaluation"] is not None
         # Should have some assessment fields
         assert any(key in data["evaluation"] for key in ["status", "score", "success", "summary"])
+        assert data["evaluation"] == STUB_EVALUATION
+
+
+
+@pytest.mark.slow
+class TestChatIntegration:
+    """End-to-end chat test through the real planner, executor and evaluator."""
+    
+    def test_chat_full_agent_pipeline(self, client):
+        """Test a message flows through the real agent pipeline."""
+        response = client.post(
+            "/api/chat",
+            json={"message": "Crea una nota sobre ServiBot"}
+        )
+        
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert isinstance(data["plan"], list)
+        assert len(data["plan"]) > 0
+        assert "results" in data["execution"]
+        assert data["evaluation"] is not None
 
 
 if __name__ == "__main__":
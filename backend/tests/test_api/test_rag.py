@@ -2,16 +2,15 @@
 Tests for RAG API endpoints
 """
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-
-client = TestClient(app)
+from app.rag.query import semantic_search, get_context_for_query
+from app.rag.embeddings import generate_embeddings, embed_query
+from app.db.chroma_client import get_chroma_client, get_collection, persist_client, reset_client
 
 
 class TestRAGEndpoints:
     """Test suite for RAG API endpoints."""
     
-    def test_rag_query_no_collection(self):
+    def test_rag_query_no_collection(self, client):
         """Test RAG query when no collection exists."""
         response = client.post(
             "/rag/query",
@@ -26,7 +25,7 @@ class TestRAGEndpoints:
             assert "query" in data
             assert "results" in data
     
-    def test_rag_query_with_results(self):
+    def test_rag_query_with_results(self, client):
         """Test RAG query with actual indexed documents."""
         # First, try to index a test document
         # (This assumes upload functionality works)
@@ -50,7 +49,7 @@ class TestRAGEndpoints:
             assert "metadata" in result
             assert "distance" in result
     
-    def test_rag_index_missing_file(self):
+    def test_rag_index_missing_file(self, client):
         """Test indexing with non-existent file."""
         response = client.post(
             "/rag/index",
@@ -60,7 +59,7 @@ class TestRAGEndpoints:
         # Should return 404 or error
         assert response.status_code in [404, 500]
     
-    def test_debug_vectors_endpoint(self):
+    def test_debug_vectors_endpoint(self, client):
         """Test debug vectors endpoint."""
         response = client.get("/debug/vectors")
         
@@ -77,8 +76,6 @@ class TestRAGQueryModule:
     
     def test_semantic_search_empty_query(self):
         """Test semantic search with empty query."""
-        from app.rag.query import semantic_search
-        
         results = semantic_search(query="", top_k=5)
         
         # Should return empty list for empty query
@@ -86,8 +83,6 @@ class TestRAGQueryModule:
     
     def test_get_context_for_query(self):
         """Test context generation for query."""
-        from app.rag.query import get_context_for_query
-        
         # Should handle gracefully even with no documents
         context = get_context_for_query(
             query="test query",
@@ -103,30 +98,27 @@ class TestRAGQueryModule:
 class TestEmbeddingsModule:
     """Test suite for embeddings module."""
     
-    def test_generate_embeddings_basic(self):
+    @pytest.fixture(scope="class")
+    def embedded(self):
+        """Embed the generate_embeddings test inputs in one batched model pass."""
+        vectors = generate_embeddings(["Hello world", "Test document"])
+        return {"hello": vectors[0], "test_doc": vectors[1]}
+    
+    def test_generate_embeddings_basic(self, embedded):
         """Test basic embedding generation."""
-        from app.rag.embeddings import generate_embeddings
-        
-        texts = ["Hello world", "Test document"]
-        embeddings = generate_embeddings(texts)
-        
-        assert len(embeddings) == 2
-        assert len(embeddings[0]) == 384  # all-MiniLM-L6-v2 dimension
-        assert isinstance(embeddings[0], list)
-        assert all(isinstance(x, float) for x in embeddings[0])
+        assert len(embedded["hello"]) == 384  # all-MiniLM-L6-v2 dimension
+        assert len(embedded["test_doc"]) == 384
+        assert isinstance(embedded["hello"], list)
+        assert all(isinstance(x, float) for x in embedded["hello"])
     
     def test_generate_embeddings_empty_list(self):
         """Test embedding generation with empty list."""
-        from app.rag.embeddings import generate_embeddings
-        
         embeddings = generate_embeddings([])
         
         assert embeddings == []
     
     def test_embed_query_single(self):
         """Test single query embedding."""
-        from app.rag.embeddings import embed_query
-        
         embedding = embed_query("test query")
         
         assert isinstance(embedding, list)
@@ -135,8 +127,6 @@ class TestEmbeddingsModule:
     
     def test_embed_query_empty(self):
         """Test single query embedding with empty string."""
-        from app.rag.embeddings import embed_query
-        
         embedding = embed_query("")
         
         assert embedding == []
@@ -147,31 +137,23 @@ class TestChromaClient:
     
     def test_get_chroma_client(self):
         """Test ChromaDB client initialization."""
-        from app.db.chroma_client import get_chroma_client
-        
         client = get_chroma_client()
         
         assert client is not None
     
     def test_get_collection(self):
         """Test collection retrieval/creation."""
-        from app.db.chroma_client import get_collection
-        
         collection = get_collection("servibot_docs")
         
         assert collection is not None
     
     def test_persist_client(self):
         """Test client persistence."""
-        from app.db.chroma_client import persist_client
-        
         # Should not raise error
         persist_client()
     
     def test_reset_client(self):
         """Test client reset."""
-        from app.db.chroma_client import reset_client, get_chroma_client
-        
         # Get client first
         client1 = get_chroma_client()
         
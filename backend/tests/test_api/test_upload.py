@@ -1,18 +1,50 @@
 """
 Tests for Upload API endpoints
 """
-import pytest
-from fastapi.testclient import TestClient
-from app.main import app
 import io
 
-client = TestClient(app)
+import pytest
+from fastapi import HTTPException
+from app.api.upload import get_upload_status
+
+
+# 1 MiB payload, allocated once at import
+_ONE_MB_PAYLOAD = b"A" * (1024 * 1024)
+
+
+@pytest.fixture(scope="module")
+def uploaded_file(app_client):
+    """Upload and index one shared document for the status and query tests.
+    
+    Returns None if the upload itself failed, so dependent tests can decide
+    whether that is an error for them.
+    """
+    file_content = b"ServiBot is an intelligent assistant. It helps users with tasks."
+    upload_response = app_client.post(
+        "/upload",
+        files={"file": ("shared.txt", io.BytesIO(file_content), "text/plain")}
+    )
+    
+    if upload_response.status_code != 200:
+        return None
+    
+    data = upload_response.json()
+    index_response = app_client.post(
+        "/rag/index",
+        json={"filename": data["filename"]}
+    )
+    
+    return {
+        "file_id": data["file_id"],
+        "filename": data["filename"],
+        "indexed": index_response.status_code == 200,
+    }
 
 
 class TestUploadEndpoint:
     """Test suite for file upload endpoint."""
     
-    def test_upload_text_file(self):
+    def test_upload_text_file(self, client):
         """Test uploading a text file."""
         file_content = b"This is a test document for ServiBot.\nIt contains sample text."
         
@@ -31,21 +63,18 @@ class TestUploadEndpoint:
         assert "file_id" in data
         assert data["filename"] == "test.txt"
     
-    def test_upload_without_file(self):
+    def test_upload_without_file(self, client):
         """Test upload endpoint without providing a file."""
         response = client.post("/upload")
         
         # Should return 422 (validation error)
         assert response.status_code == 422
     
-    def test_upload_large_file(self):
+    def test_upload_large_file(self, client):
         """Test uploading a larger file."""
-        # Create a 1MB test file
-        file_content = b"A" * (1024 * 1024)
-        
         response = client.post(
             "/upload",
-            files={"file": ("large.txt", io.BytesIO(file_content), "text/plain")}
+            files={"file": ("large.txt", io.BytesIO(_ONE_MB_PAYLOAD), "text/plain")}
         )
         
         # Should handle or reject gracefully
@@ -59,20 +88,11 @@ class TestUploadEndpoint:
 class TestUploadStatusEndpoint:
     """Test suite for upload status endpoint."""
     
-    def test_upload_status_existing_file(self):
+    def test_upload_status_existing_file(self, client, uploaded_file):
         """Test status check for existing uploaded file."""
-        # First upload a file
-        file_content = b"Test content for status check"
-        upload_response = client.post(
-            "/upload",
-            files={"file": ("status_test.txt", io.BytesIO(file_content), "text/plain")}
-        )
-        
-        if upload_response.status_code == 200:
-            file_id = upload_response.json()["file_id"]
-            
+        if uploaded_file is not None:
             # Check status
-            status_response = client.get(f"/upload/status/{file_id}")
+            status_response = client.get(f"/upload/status/{uploaded_file['file_id']}")
             
             assert status_response.status_code == 200
             data = status_response.json()
@@ -80,8 +100,16 @@ class TestUploadStatusEndpoint:
             assert "file_id" in data
             assert "status" in data
     
-    def test_upload_status_nonexistent_file(self):
-        """Test status check for non-existent file."""
+    async def test_upload_status_nonexistent_file(self):
+        """Test status lookup for non-existent file (direct call, no HTTP)."""
+        with pytest.raises(HTTPException) as exc_info:
+            await get_upload_status("nonexistent_file_id")
+        
+        assert exc_info.value.status_code == 404
+    
+    @pytest.mark.slow
+    def test_upload_status_nonexistent_file_http(self, client):
+        """Test status check for non-existent file through the HTTP route."""
         response = client.get("/upload/status/nonexistent_file_id")
         
         # Should return 404 or error status
@@ -95,7 +123,7 @@ class TestUploadStatusEndpoint:
 class TestReindexEndpoint:
     """Test suite for reindex endpoint."""
     
-    def test_reindex_all_documents(self):
+    def test_reindex_all_documents(self, client):
         """Test reindexing all documents."""
         response = client.post("/upload/reindex")
         
@@ -106,7 +134,7 @@ class TestReindexEndpoint:
         assert "status" in data
         # status can be "success" or provide information about indexed files
     
-    def test_reindex_empty_directory(self):
+    def test_reindex_empty_directory(self, client):
         """Test reindex when no files are uploaded."""
         # Clear uploads first (if endpoint exists)
         response = client.post("/upload/reindex")
@@ -121,25 +149,13 @@ class TestReindexEndpoint:
 class TestUploadIntegration:
     """Integration tests for upload + RAG indexing flow."""
     
-    def test_upload_and_query_flow(self):
+    @pytest.mark.slow
+    def test_upload_and_query_flow(self, client, uploaded_file):
         """Test full flow: upload file -> index -> query."""
-        # 1. Upload file
-        file_content = b"ServiBot is an intelligent assistant. It helps users with tasks."
-        upload_response = client.post(
-            "/upload",
-            files={"file": ("integration_test.txt", io.BytesIO(file_content), "text/plain")}
-        )
-        
-        assert upload_response.status_code == 200
-        filename = upload_response.json()["filename"]
-        
-        # 2. Index file
-        index_response = client.post(
-            "/rag/index",
-            json={"filename": filename}
-        )
+        # 1-2. Upload and index happen once in the shared fixture
+        assert uploaded_file is not None
         
-        if index_response.status_code == 200:
+        if uploaded_file["indexed"]:
             # 3. Query indexed content
             query_response = client.post(
                 "/rag/query",
@@ -159,7 +175,7 @@ class TestUploadIntegration:
 class TestListUploadsEndpoint:
     """Test suite for listing uploaded files."""
     
-    def test_list_uploads(self):
+    def test_list_uploads(self, client):
         """Test listing all uploaded files."""
         response = client.get("/upload/list")
         
@@ -4,20 +4,36 @@ Tests for file_writer tool - PDF and Excel generation
 import pytest
 from pathlib import Path
 import os
-import tempfile
 from app.tools.file_writer import FileWriterTool, get_file_writer
 
 
-@pytest.fixture
-def temp_output_dir():
-    """Create temporary directory for test outputs"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+LONG_CONTENT = "Test paragraph.\n\n" * 100
 
+# Every Excel scenario as its own sheet, written once by the multi_excel fixture
+EXCEL_SHEETS = {
+    "Sheet1": [
+        ["Name", "Age", "City"],
+        ["Alice", 30, "Madrid"],
+        ["Bob", 25, "Barcelona"]
+    ],
+    "Users": [["ID", "Name"], [1, "Alice"], [2, "Bob"]],
+    "Products": [["SKU", "Price"], ["A1", 100], ["A2", 200]],
+    "Orders": [["OrderID", "Total"], [1001, 300]],
+    "Data": [[1, 2, 3], [4, 5, 6]],
+    "EmptySheet": [],
+}
+EXCEL_HEADERS = {"Data": ["Col1", "Col2", "Col3"]}
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
+def temp_output_dir(tmp_path_factory):
+    """Create one temporary directory for all test outputs in this module"""
+    return str(tmp_path_factory.mktemp("fw"))
+
+
+@pytest.fixture(scope="module")
 def file_writer(temp_output_dir):
-    """Create FileWriterTool instance with temp directory"""
+    """Create one FileWriterTool instance per module, writing to the temp directory"""
     return FileWriterTool(output_dir=temp_output_dir)
 
 
@@ -74,79 +90,62 @@ class TestFileWriterTool:
 
     def test_generate_pdf_long_content(self, file_writer):
         """Test PDF handles multi-page content"""
-        long_content = "Test paragraph.\n\n" * 100
-        
         result = file_writer.generate_pdf(
             title="Long Report",
-            content=long_content,
+            content=LONG_CONTENT,
             filename="long_report.pdf"
         )
         
         assert result["status"] == "success"
         assert os.path.exists(result["file_path"])
 
-    def test_generate_excel_basic(self, file_writer):
-        """Test basic Excel generation"""
-        sheets = {
-            "Sheet1": [
-                ["Name", "Age", "City"],
-                ["Alice", 30, "Madrid"],
-                ["Bob", 25, "Barcelona"]
-            ]
-        }
-        
-        result = file_writer.generate_excel(
-            filename="test_data.xlsx",
-            sheets=sheets
+    @pytest.fixture(scope="class")
+    def multi_excel(self, file_writer):
+        """Generate one workbook holding every Excel scenario as a sheet"""
+        return file_writer.generate_excel(
+            filename="multi_scenario.xlsx",
+            sheets=EXCEL_SHEETS,
+            headers=EXCEL_HEADERS
         )
+
+    @pytest.fixture(scope="class")
+    def multi_excel_rows(self, multi_excel):
+        """Read back the cell values of each sheet in the shared workbook"""
+        from openpyxl import load_workbook
         
-        assert result["status"] == "success"
-        assert "file_path" in result
-        assert result["format"] == "excel"
-        assert os.path.exists(result["file_path"])
-        assert result["file_path"].endswith(".xlsx")
+        wb = load_workbook(multi_excel["file_path"], read_only=True)
+        try:
+            return {ws.title: list(ws.iter_rows(values_only=True)) for ws in wb.worksheets}
+        finally:
+            wb.close()
+
+    def test_generate_excel_basic(self, multi_excel, multi_excel_rows):
+        """Test basic Excel generation"""
+        assert multi_excel["status"] == "success"
+        assert "file_path" in multi_excel
+        assert multi_excel["format"] == "excel"
+        assert os.path.exists(multi_excel["file_path"])
+        assert multi_excel["file_path"].endswith(".xlsx")
+        assert multi_excel_rows["Sheet1"] == [tuple(row) for row in EXCEL_SHEETS["Sheet1"]]
 
-    def test_generate_excel_multiple_sheets(self, file_writer):
+    def test_generate_excel_multiple_sheets(self, multi_excel, multi_excel_rows):
         """Test Excel with multiple sheets"""
-        sheets = {
-            "Users": [["ID", "Name"], [1, "Alice"], [2, "Bob"]],
-            "Products": [["SKU", "Price"], ["A1", 100], ["A2", 200]],
-            "Orders": [["OrderID", "Total"], [1001, 300]]
-        }
-        
-        result = file_writer.generate_excel(
-            filename="multi_sheet.xlsx",
-            sheets=sheets
-        )
-        
-        assert result["status"] == "success"
-        assert os.path.exists(result["file_path"])
+        assert multi_excel["status"] == "success"
+        assert multi_excel["sheets"] == list(EXCEL_SHEETS)
+        for name in ("Users", "Products", "Orders"):
+            assert multi_excel_rows[name] == [tuple(row) for row in EXCEL_SHEETS[name]]
 
-    def test_generate_excel_with_headers(self, file_writer):
+    def test_generate_excel_with_headers(self, multi_excel, multi_excel_rows):
         """Test Excel with header formatting"""
-        sheets = {"Data": [[1, 2, 3], [4, 5, 6]]}
-        headers = {"Data": ["Col1", "Col2", "Col3"]}
-        
-        result = file_writer.generate_excel(
-            filename="with_headers.xlsx",
-            sheets=sheets,
-            headers=headers
-        )
-        
-        assert result["status"] == "success"
-        assert os.path.exists(result["file_path"])
+        assert multi_excel["status"] == "success"
+        assert multi_excel_rows["Data"][0] == tuple(EXCEL_HEADERS["Data"])
+        assert multi_excel_rows["Data"][1:] == [tuple(row) for row in EXCEL_SHEETS["Data"]]
 
-    def test_generate_excel_empty_sheet(self, file_writer):
+    def test_generate_excel_empty_sheet(self, multi_excel, multi_excel_rows):
         """Test Excel handles empty sheets"""
-        sheets = {"EmptySheet": []}
-        
-        result = file_writer.generate_excel(
-            filename="empty_sheet.xlsx",
-            sheets=sheets
-        )
-        
-        assert result["status"] == "success"
-        assert os.path.exists(result["file_path"])
+        assert multi_excel["status"] == "success"
+        assert "EmptySheet" in multi_excel_rows
+        assert all(value is None for row in multi_excel_rows["EmptySheet"] for value in row)
 
     def test_generate_report_pdf(self, file_writer):
         """Test high-level report generation (PDF)"""
@@ -2,27 +2,59 @@
 Tests for OCR tool - Text extraction from images
 """
 import pytest
+from collections import namedtuple
 from pathlib import Path
+import io
 import os
+import shutil
 from PIL import Image, ImageDraw, ImageFont
-import tempfile
 from app.tools.ocr_tool import OCRTool, get_ocr_tool
 
+pytesseract = pytest.importorskip("pytesseract")
 
-@pytest.fixture
-def temp_dir():
-    """Create temporary directory for test images"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+
+# Sample image on disk plus the in-memory PIL image it was saved from
+Sample = namedtuple("Sample", "path img")
+
+# Real OCR needs the tesseract binary, not just the pytesseract wrapper
+requires_tesseract = pytest.mark.skipif(
+    shutil.which("tesseract") is None, reason="tesseract binary not installed"
+)
+
+# Canned pytesseract.image_to_data output (Output.DICT) for shape-only tests
+FAKE_OCR_DATA = {
+    "text": ["", "Hello", "World"],
+    "conf": [-1, 91, 87],
+    "left": [0, 20, 70],
+    "top": [0, 50, 50],
+    "width": [400, 45, 45],
+    "height": [200, 12, 12],
+    "block_num": [1, 1, 1],
+    "par_num": [0, 1, 1],
+    "line_num": [0, 1, 1],
+}
 
 
 @pytest.fixture
+def patched_ocr(monkeypatch):
+    """Stub the tesseract calls so tests checking result shape skip real OCR"""
+    monkeypatch.setattr(pytesseract, "image_to_string", lambda *a, **kw: "Hello World")
+    monkeypatch.setattr(pytesseract, "image_to_data", lambda *a, **kw: FAKE_OCR_DATA)
+
+
+@pytest.fixture(scope="module")
+def temp_dir(tmp_path_factory):
+    """Create one temporary directory for test images in this module"""
+    return str(tmp_path_factory.mktemp("ocr"))
+
+
+@pytest.fixture(scope="module")
 def ocr_tool():
-    """Create OCRTool instance"""
+    """Create one OCRTool instance shared by the module"""
     return OCRTool(languages="eng+spa")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_image_with_text(temp_dir):
     """Create a test image with text"""
     img = Image.new('RGB', (400, 200), color='white')
@@ -34,10 +66,10 @@ def sample_image_with_text(temp_dir):
     
     image_path = os.path.join(temp_dir, "test_text.png")
     img.save(image_path)
-    return image_path
+    return Sample(image_path, img)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_image_noisy(temp_dir):
     """Create a noisy test image"""
     img = Image.new('RGB', (300, 150), color='lightgray')
@@ -46,10 +78,10 @@ def sample_image_noisy(temp_dir):
     
     image_path = os.path.join(temp_dir, "noisy.png")
     img.save(image_path)
-    return image_path
+    return Sample(image_path, img)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_image_small(temp_dir):
     """Create a small test image"""
     img = Image.new('RGB', (100, 50), color='white')
@@ -58,9 +90,10 @@ def sample_image_small(temp_dir):
     
     image_path = os.path.join(temp_dir, "small.png")
     img.save(image_path)
-    return image_path
+    return Sample(image_path, img)
 
 
+@pytest.mark.usefixtures("patched_ocr")
 class TestOCRTool:
     """Test suite for OCRTool"""
 
@@ -75,18 +108,18 @@ class TestOCRTool:
 
     def test_extract_text_basic(self, ocr_tool, sample_image_with_text):
         """Test basic text extraction"""
-        result = ocr_tool.extract_text_from_image(sample_image_with_text)
+        result = ocr_tool.extract_text_from_image(sample_image_with_text.img)
         
         assert result["status"] == "success"
         assert "text" in result
         assert len(result["text"]) > 0
-        assert "avg_confidence" in result
-        assert result["avg_confidence"] >= 0
+        assert "confidence" in result
+        assert result["confidence"] >= 0
 
     def test_extract_text_with_preprocessing(self, ocr_tool, sample_image_noisy):
         """Test extraction with image preprocessing"""
         result = ocr_tool.extract_text_from_image(
-            sample_image_noisy,
+            sample_image_noisy.path,
             preprocess=True
         )
         
@@ -96,7 +129,7 @@ class TestOCRTool:
     def test_extract_text_without_preprocessing(self, ocr_tool, sample_image_with_text):
         """Test extraction without preprocessing"""
         result = ocr_tool.extract_text_from_image(
-            sample_image_with_text,
+            sample_image_with_text.path,
             preprocess=False
         )
         
@@ -121,9 +154,18 @@ class TestOCRTool:
         assert result["status"] == "error"
         assert "error" in result
 
+    def test_load_image_from_bytes(self, ocr_tool, sample_image_with_text):
+        """Test in-memory PNG bytes and PIL images are accepted as input"""
+        buffer = io.BytesIO()
+        sample_image_with_text.img.save(buffer, format='PNG')
+        buffer.seek(0)
+        
+        assert ocr_tool._load_image(buffer).size == sample_image_with_text.img.size
+        assert ocr_tool._load_image(sample_image_with_text.img) is sample_image_with_text.img
+
     def test_preprocess_image_small(self, ocr_tool, sample_image_small):
         """Test preprocessing resizes small images"""
-        img = Image.open(sample_image_small)
+        img = sample_image_small.img
         processed = ocr_tool._preprocess_image(img)
         
         # Should be resized
@@ -131,15 +173,14 @@ class TestOCRTool:
 
     def test_preprocess_image_normal(self, ocr_tool, sample_image_with_text):
         """Test preprocessing doesn't break normal images"""
-        img = Image.open(sample_image_with_text)
-        processed = ocr_tool._preprocess_image(img)
+        processed = ocr_tool._preprocess_image(sample_image_with_text.img)
         
         # Should be grayscale
         assert processed.mode == 'L'
 
     def test_batch_extract_multiple_images(self, ocr_tool, sample_image_with_text, sample_image_noisy):
         """Test batch extraction with multiple images"""
-        image_paths = [sample_image_with_text, sample_image_noisy]
+        image_paths = [sample_image_with_text.path, sample_image_noisy.path]
         
         result = ocr_tool.batch_extract(image_paths)
         
@@ -159,7 +200,7 @@ class TestOCRTool:
     def test_batch_extract_with_preprocessing(self, ocr_tool, sample_image_with_text):
         """Test batch extraction with preprocessing enabled"""
         result = ocr_tool.batch_extract(
-            [sample_image_with_text],
+            [sample_image_with_text.path],
             preprocess=True
         )
         
@@ -168,7 +209,7 @@ class TestOCRTool:
 
     def test_batch_extract_mixed_valid_invalid(self, ocr_tool, sample_image_with_text):
         """Test batch extraction with mix of valid and invalid files"""
-        image_paths = [sample_image_with_text, "nonexistent.png"]
+        image_paths = [sample_image_with_text.path, "nonexistent.png"]
         
         result = ocr_tool.batch_extract(image_paths)
         
@@ -178,7 +219,7 @@ class TestOCRTool:
 
     def test_extract_with_layout_basic(self, ocr_tool, sample_image_with_text):
         """Test layout extraction returns structured data"""
-        result = ocr_tool.extract_text_with_layout(sample_image_with_text)
+        result = ocr_tool.extract_text_with_layout(sample_image_with_text.img)
         
         assert result["status"] == "success"
         assert "layout_data" in result
@@ -187,7 +228,7 @@ class TestOCRTool:
     def test_extract_with_layout_preprocess(self, ocr_tool, sample_image_with_text):
         """Test layout extraction with preprocessing"""
         result = ocr_tool.extract_text_with_layout(
-            sample_image_with_text,
+            sample_image_with_text.path,
             preprocess=True
         )
         
@@ -203,14 +244,14 @@ class TestOCRTool:
 
     def test_confidence_scoring(self, ocr_tool, sample_image_with_text):
         """Test confidence score is calculated"""
-        result = ocr_tool.extract_text_from_image(sample_image_with_text)
+        result = ocr_tool.extract_text_from_image(sample_image_with_text.img)
         
         if result["status"] == "success" and result.get("word_count", 0) > 0:
-            assert 0 <= result["avg_confidence"] <= 100
+            assert 0 <= result["confidence"] <= 100
 
     def test_word_count_tracking(self, ocr_tool, sample_image_with_text):
         """Test word count is tracked"""
-        result = ocr_tool.extract_text_from_image(sample_image_with_text)
+        result = ocr_tool.extract_text_from_image(sample_image_with_text.img)
         
         if result["status"] == "success":
             assert "word_count" in result
@@ -230,7 +271,7 @@ class TestOCRTool:
     def test_custom_config(self, ocr_tool, sample_image_with_text):
         """Test custom Tesseract config"""
         result = ocr_tool.extract_text_from_image(
-            sample_image_with_text,
+            sample_image_with_text.path,
             config="--psm 6"  # Assume uniform block of text
         )
         
@@ -255,6 +296,8 @@ class TestOCRToolSingleton:
 class TestOCRToolEdgeCases:
     """Test edge cases and error handling"""
 
+    @pytest.mark.integration
+    @requires_tesseract
     def test_empty_image(self, ocr_tool, temp_dir):
         """Test OCR on blank image"""
         blank_img = Image.new('RGB', (200, 100), color='white')
@@ -267,6 +310,8 @@ class TestOCRToolEdgeCases:
         # Empty or whitespace text expected
         assert result.get("word_count", 0) == 0 or result["text"].strip() == ""
 
+    @pytest.mark.usefixtures("patched_ocr")
+    @pytest.mark.slow
     def test_very_large_image(self, ocr_tool, temp_dir):
         """Test OCR on large image"""
         large_img = Image.new('RGB', (3000, 2000), color='white')
@@ -281,6 +326,7 @@ class TestOCRToolEdgeCases:
         # Should handle without crashing
         assert result["status"] in ["success", "error"]
 
+    @pytest.mark.usefixtures("patched_ocr")
     def test_image_with_special_chars_filename(self, ocr_tool, temp_dir):
         """Test OCR with filename containing special characters"""
         img = Image.new('RGB', (200, 100), color='white')
@@ -295,9 +341,10 @@ class TestOCRToolEdgeCases:
         
         assert result["status"] in ["success", "error"]
 
+    @pytest.mark.usefixtures("patched_ocr")
     def test_batch_summary_statistics(self, ocr_tool, sample_image_with_text, sample_image_noisy):
         """Test batch extraction summary contains correct stats"""
-        result = ocr_tool.batch_extract([sample_image_with_text, sample_image_noisy])
+        result = ocr_tool.batch_extract([sample_image_with_text.path, sample_image_noisy.path])
         
         summary = result["summary"]
         assert summary["total_files"] == 2
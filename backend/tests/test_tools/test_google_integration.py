@@ -2,8 +2,8 @@
 Tests for Google OAuth integration
 """
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
+from types import SimpleNamespace
 
 from app.services.google_oauth import (
     build_oauth_flow,
@@ -15,6 +15,41 @@ from app.tools.calendar_tool import CalendarTool
 from app.tools.email_tool import EmailTool
 
 
+MOCK_EVENT = {
+    'id': 'test_event_123',
+    'htmlLink': 'https://calendar.google.com/event?eid=test',
+    'summary': 'Test Event',
+    'start': {'dateTime': '2026-01-15T10:00:00Z'},
+    'end': {'dateTime': '2026-01-15T11:00:00Z'}
+}
+
+MOCK_SENT_MESSAGE = {
+    'id': 'msg_123',
+    'threadId': 'thread_456'
+}
+
+
+@pytest.fixture(scope="module")
+def calendar_service_mock():
+    """Calendar API stub exposing only the events().insert().execute() chain."""
+    events = SimpleNamespace(insert=lambda **kw: SimpleNamespace(execute=lambda: MOCK_EVENT))
+    return SimpleNamespace(events=lambda: events)
+
+
+@pytest.fixture(scope="module")
+def gmail_service_mock():
+    """Gmail API stub exposing only the users().messages().send().execute() chain."""
+    messages = SimpleNamespace(send=lambda **kw: SimpleNamespace(execute=lambda: MOCK_SENT_MESSAGE))
+    users = SimpleNamespace(messages=lambda: messages)
+    return SimpleNamespace(users=lambda: users)
+
+
+@pytest.fixture(scope="class")
+def oauth_flow():
+    """OAuth flow built once per test class."""
+    return build_oauth_flow()
+
+
 class TestGoogleOAuth:
     """Test Google OAuth service."""
     
@@ -24,10 +59,9 @@ class TestGoogleOAuth:
         assert flow is not None
         assert flow.redirect_uri == "http://localhost:8000/auth/google/callback"
     
-    def test_get_authorization_url(self):
+    def test_get_authorization_url(self, oauth_flow):
         """Test getting authorization URL."""
-        flow = build_oauth_flow()
-        auth_url, state = get_authorization_url(flow)
+        auth_url, state = get_authorization_url(oauth_flow)
         
         assert auth_url is not None
         assert "accounts.google.com" in auth_url
@@ -36,14 +70,15 @@ class TestGoogleOAuth:
     
     def test_credentials_to_dict(self):
         """Test converting credentials to dict."""
-        mock_creds = Mock()
-        mock_creds.token = "test_token"
-        mock_creds.refresh_token = "test_refresh"
-        mock_creds.token_uri = "https://oauth2.googleapis.com/token"
-        mock_creds.client_id = "test_client_id"
-        mock_creds.client_secret = "test_client_secret"
-        mock_creds.scopes = ["calendar", "gmail"]
-        mock_creds.expiry = datetime(2026, 1, 15, 10, 0, 0)
+        mock_creds = SimpleNamespace(
+            token="test_token",
+            refresh_token="test_refresh",
+            token_uri="https://oauth2.googleapis.com/token",
+            client_id="test_client_id",
+            client_secret="test_client_secret",
+            scopes=["calendar", "gmail"],
+            expiry=datetime(2026, 1, 15, 10, 0, 0)
+        )
         
         result = credentials_to_dict(mock_creds)
         
@@ -71,130 +106,89 @@ class TestGoogleOAuth:
         assert creds.client_id == "test_client_id"
 
 
-class TestCalendarTool:
-    """Test CalendarTool."""
+# Tool class, tool name; credential lookup is patched in app.tools.<name>_tool
+google_tools = pytest.mark.parametrize("tool_cls,name", [
+    pytest.param(CalendarTool, "calendar", id="calendar"),
+    pytest.param(EmailTool, "email", id="email"),
+])
+
+
+@google_tools
+def test_tool_properties(tool_cls, name):
+    """Test tool basic properties."""
+    tool = tool_cls()
+    assert tool.name == name
+    assert tool.description is not None
+    assert len(tool.description) > 0
+
+
+@google_tools
+def test_get_schema(tool_cls, name):
+    """Test getting tool schema."""
+    schema = tool_cls().get_schema()
     
-    def test_tool_properties(self):
-        """Test tool basic properties."""
-        tool = CalendarTool()
-        assert tool.name == "calendar"
-        assert tool.description is not None
-        assert len(tool.description) > 0
+    assert schema.name == name
+    assert len(schema.parameters) > 0
     
-    def test_get_schema(self):
-        """Test getting tool schema."""
-        tool = CalendarTool()
-        schema = tool.get_schema()
-        
-        assert schema.name == "calendar"
-        assert len(schema.parameters) > 0
-        
-        # Check that action parameter exists
-        action_param = next((p for p in schema.parameters if p.name == "action"), None)
-        assert action_param is not None
-        assert action_param.required is True
+    # Check that action parameter exists
+    action_param = next((p for p in schema.parameters if p.name == "action"), None)
+    assert action_param is not None
+    assert action_param.required is True
+
+
+@google_tools
+async def test_execute_without_credentials(monkeypatch, tool_cls, name):
+    """Test executing without credentials returns error."""
+    tool = tool_cls()
+    monkeypatch.setattr(f'app.tools.{name}_tool.get_credentials_for_user', lambda *a, **k: None)
     
-    @pytest.mark.asyncio
-    async def test_execute_without_credentials(self):
-        """Test executing without credentials returns error."""
-        tool = CalendarTool()
-        
-        with patch('app.tools.calendar_tool.get_credentials_for_user', return_value=None):
-            result = await tool.execute({
-                "action": "list"
-            }, user_id="test_user")
-            
-            assert result['success'] is False
-            assert "not authenticated" in result['error'].lower()
+    result = await tool.execute({
+        "action": "list"
+    }, user_id="test_user")
+    
+    assert result['success'] is False
+    assert "not authenticated" in result['error'].lower()
+
+
+class TestCalendarTool:
+    """Test CalendarTool."""
     
-    @pytest.mark.asyncio
-    async def test_create_event_with_mock(self):
+    async def test_create_event_with_mock(self, monkeypatch, calendar_service_mock):
         """Test creating event with mocked credentials."""
         tool = CalendarTool()
         
-        mock_creds = Mock()
-        mock_service = MagicMock()
-        mock_event = {
-            'id': 'test_event_123',
-            'htmlLink': 'https://calendar.google.com/event?eid=test',
-            'summary': 'Test Event',
-            'start': {'dateTime': '2026-01-15T10:00:00Z'},
-            'end': {'dateTime': '2026-01-15T11:00:00Z'}
-        }
+        mock_creds = SimpleNamespace()
+        monkeypatch.setattr('app.tools.calendar_tool.get_credentials_for_user', lambda *a, **k: mock_creds)
+        monkeypatch.setattr('app.tools.calendar_tool.build', lambda *a, **k: calendar_service_mock)
         
-        mock_service.events().insert().execute.return_value = mock_event
+        result = await tool.execute({
+            "action": "create",
+            "summary": "Test Event",
+            "start_time": "2026-01-15T10:00:00Z",
+            "end_time": "2026-01-15T11:00:00Z"
+        }, user_id="test_user")
         
-        with patch('app.tools.calendar_tool.get_credentials_for_user', return_value=mock_creds):
-            with patch('app.tools.calendar_tool.build', return_value=mock_service):
-                result = await tool.execute({
-                    "action": "create",
-                    "summary": "Test Event",
-                    "start_time": "2026-01-15T10:00:00Z",
-                    "end_time": "2026-01-15T11:00:00Z"
-                }, user_id="test_user")
-                
-                assert result['success'] is True
-                assert result['event_id'] == 'test_event_123'
+        assert result['success'] is True
+        assert result['event_id'] == 'test_event_123'
 
 
 class TestEmailTool:
     """Test EmailTool."""
     
-    def test_tool_properties(self):
-        """Test tool basic properties."""
-        tool = EmailTool()
-        assert tool.name == "email"
-        assert tool.description is not None
-        assert len(tool.description) > 0
-    
-    def test_get_schema(self):
-        """Test getting tool schema."""
-        tool = EmailTool()
-        schema = tool.get_schema()
-        
-        assert schema.name == "email"
-        assert len(schema.parameters) > 0
-        
-        # Check that action parameter exists
-        action_param = next((p for p in schema.parameters if p.name == "action"), None)
-        assert action_param is not None
-        assert action_param.required is True
-    
-    @pytest.mark.asyncio
-    async def test_execute_without_credentials(self):
-        """Test executing without credentials returns error."""
-        tool = EmailTool()
-        
-        with patch('app.tools.email_tool.get_credentials_for_user', return_value=None):
-            result = await tool.execute({
-                "action": "list"
-            }, user_id="test_user")
-            
-            assert result['success'] is False
-            assert "not authenticated" in result['error'].lower()
-    
-    @pytest.mark.asyncio
-    async def test_send_email_with_mock(self):
+    async def test_send_email_with_mock(self, monkeypatch, gmail_service_mock):
         """Test sending email with mocked credentials."""
         tool = EmailTool()
         
-        mock_creds = Mock()
-        mock_service = MagicMock()
-        mock_sent = {
-            'id': 'msg_123',
-            'threadId': 'thread_456'
-        }
+        mock_creds = SimpleNamespace()
+        monkeypatch.setattr('app.tools.email_tool.get_credentials_for_user', lambda *a, **k: mock_creds)
+        monkeypatch.setattr('app.tools.email_tool.build', lambda *a, **k: gmail_service_mock)
         
-        mock_service.users().messages().send().execute.return_value = mock_sent
+        result = await tool.execute({
+            "action": "send",
+            "to": "test@example.com",
+            "subject": "Test Email",
+            "body": "This is a test"
+        }, user_id="test_user")
         
-        with patch('app.tools.email_tool.get_credentials_for_user', return_value=mock_creds):
-            with patch('app.tools.email_tool.build', return_value=mock_service):
-                result = await tool.execute({
-                    "action": "send",
-                    "to": "test@example.com",
-                    "subject": "Test Email",
-                    "body": "This is a test"
-                }, user_id="test_user")
-                
-                assert result['success'] is True
-                assert result['message_id'] == 'msg_123'
+        assert result['success'] is True
+        assert result['message_id'] == 'msg_123'
@@ -2,36 +2,98 @@
 Tests for Voice API endpoints - Whisper STT and TTS
 """
 import pytest
-from fastapi.testclient import TestClient
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import MagicMock
+from types import SimpleNamespace
+import importlib.util
+import json
 import os
-import tempfile
 from pathlib import Path
 
-# Import the FastAPI app
-from app.main import app
 
+FAKE_AUDIO = b"fake audio data"
 
-@pytest.fixture
-def client():
-    """Create test client"""
-    return TestClient(app)
+# ID3v2 tag header followed by an MPEG-1 Layer III frame sync
+FAKE_MP3 = b"ID3\x03\x00\x00\x00\x00\x00\x00\xff\xfb\x90\x00"
 
+# Long synthesis request, JSON-encoded once at import
+_LONG_PAYLOAD = json.dumps({
+    "text": "This is a very long sentence. " * 50,
+    "language": "en",
+    "engine": "gtts"
+}).encode()
 
-@pytest.fixture
-def temp_audio_dir():
-    """Create temporary directory for audio files"""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+
+@pytest.fixture(scope="module", autouse=True)
+def temp_audio_dir(tmp_path_factory):
+    """Point AUDIO_DIR at one temporary directory for the whole module"""
+    audio_dir = str(tmp_path_factory.mktemp("audio"))
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('app.api.voice.AUDIO_DIR', audio_dir)
+        yield audio_dir
+
+
+@pytest.fixture(scope="module")
+def served_audio_files(temp_audio_dir):
+    """Write one test.<ext> file per servable extension, once per module"""
+    for ext in ("mp3", "wav", "ogg"):
+        with open(os.path.join(temp_audio_dir, f"test.{ext}"), 'wb') as f:
+            f.write(FAKE_AUDIO)
+
+
+def _write_fake_audio(path, *args, **kwargs):
+    with open(path, 'wb') as f:
+        f.write(FAKE_MP3)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _fake_tts_engines():
+    """Replace gTTS and pyttsx3 once for the module so synthesis never hits the network or audio stack.
+    
+    Both fakes write FAKE_MP3 to the requested path, so the endpoint sees a real file.
+    Engines that are not installed are left alone; their tests skip themselves.
+    """
+    # Explicit specs so only the attributes voice.py touches exist as children
+    fake_tts = MagicMock(spec_set=["save"])
+    fake_tts.save.side_effect = _write_fake_audio
+    fake_gtts = MagicMock(spec_set=[], return_value=fake_tts)
+    
+    fake_engine = MagicMock(spec_set=["setProperty", "save_to_file", "runAndWait"])
+    fake_engine.save_to_file.side_effect = lambda text, path: _write_fake_audio(path)
+    
+    with pytest.MonkeyPatch.context() as mp:
+        if importlib.util.find_spec("gtts") is not None:
+            mp.setattr("gtts.gTTS", fake_gtts)
+        if importlib.util.find_spec("pyttsx3") is not None:
+            mp.setattr("pyttsx3.init", lambda *a, **k: fake_engine)
+        yield
+
+
+def _whisper_model(**transcribe):
+    """Whisper model stub whose transcribe() is configured once and then only read."""
+    model = MagicMock(spec_set=["transcribe"])
+    model.transcribe.configure_mock(**transcribe)
+    return model
+
+
+# Whisper model stubs built once at import; tests pick one and never reconfigure it
+_WHISPER_EN = _whisper_model(return_value={"text": "Hello, this is a test transcription", "language": "en"})
+_WHISPER_ES = _whisper_model(return_value={"text": "Hola, esto es una prueba", "language": "es"})
+_WHISPER_SILENT = _whisper_model(return_value={"text": "", "language": "en"})
+_WHISPER_BROKEN = _whisper_model(side_effect=Exception("Failed to decode audio"))
 
 
 @pytest.fixture
-def sample_audio_file(temp_audio_dir):
-    """Create a mock audio file"""
-    audio_path = os.path.join(temp_audio_dir, "test.mp3")
-    with open(audio_path, 'wb') as f:
-        f.write(b"fake audio data")
-    return audio_path
+def use_whisper(monkeypatch):
+    """Serve a prebuilt Whisper model through _get_whisper (English by default).
+    
+    Call the returned function with another model to switch.
+    """
+    def install(model):
+        fake_whisper = SimpleNamespace(load_model=lambda *a, **k: model)
+        monkeypatch.setattr('app.api.voice._get_whisper', lambda: fake_whisper)
+    
+    install(_WHISPER_EN)
+    return install
 
 
 class TestVoiceStatus:
@@ -58,22 +120,12 @@ class TestVoiceStatus:
 class TestVoiceTranscription:
     """Test transcription endpoint"""
 
-    @patch('app.api.voice.whisper.load_model')
-    def test_transcribe_audio_success(self, mock_load_model, client, sample_audio_file):
+    def test_transcribe_audio_success(self, use_whisper, client):
         """Test successful audio transcription"""
-        # Mock Whisper model
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {
-            "text": "Hello, this is a test transcription",
-            "language": "en"
-        }
-        mock_load_model.return_value = mock_model
-        
-        with open(sample_audio_file, 'rb') as f:
-            response = client.post(
-                "/api/voice/transcribe",
-                files={"file": ("test.mp3", f, "audio/mpeg")}
-            )
+        response = client.post(
+            "/api/voice/transcribe",
+            files={"file": ("test.mp3", FAKE_AUDIO, "audio/mpeg")}
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -89,64 +141,35 @@ class TestVoiceTranscription:
         
         assert response.status_code == 422  # Validation error
 
-    @patch('app.api.voice.whisper.load_model')
-    def test_transcribe_invalid_format(self, mock_load_model, client, temp_audio_dir):
+    def test_transcribe_invalid_format(self, use_whisper, client):
         """Test transcription with invalid file format"""
-        # Create non-audio file
-        invalid_file = os.path.join(temp_audio_dir, "test.txt")
-        with open(invalid_file, 'w') as f:
-            f.write("Not an audio file")
-        
-        with open(invalid_file, 'rb') as f:
-            response = client.post(
-                "/api/voice/transcribe",
-                files={"file": ("test.txt", f, "text/plain")}
-            )
+        response = client.post(
+            "/api/voice/transcribe",
+            files={"file": ("test.txt", b"Not an audio file", "text/plain")}
+        )
         
         # Should reject or handle gracefully
         assert response.status_code in [400, 422, 500]
 
-    @patch('app.api.voice.whisper.load_model')
-    def test_transcribe_different_formats(self, mock_load_model, client, temp_audio_dir):
+    @pytest.mark.parametrize("fmt", ["mp3", "wav", "m4a", "ogg"])
+    def test_transcribe_different_formats(self, use_whisper, client, fmt):
         """Test transcription supports multiple audio formats"""
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {
-            "text": "Test transcription",
-            "language": "en"
-        }
-        mock_load_model.return_value = mock_model
-        
-        formats = ["mp3", "wav", "m4a", "ogg"]
+        response = client.post(
+            "/api/voice/transcribe",
+            files={"file": (f"test.{fmt}", FAKE_AUDIO, f"audio/{fmt}")}
+        )
         
-        for fmt in formats:
-            audio_file = os.path.join(temp_audio_dir, f"test.{fmt}")
-            with open(audio_file, 'wb') as f:
-                f.write(b"fake audio data")
-            
-            with open(audio_file, 'rb') as f:
-                response = client.post(
-                    "/api/voice/transcribe",
-                    files={"file": (f"test.{fmt}", f, f"audio/{fmt}")}
-                )
-            
-            # Should accept all supported formats
-            assert response.status_code in [200, 500]  # 500 if Whisper fails on fake data
-
-    @patch('app.api.voice.whisper.load_model')
-    def test_transcribe_spanish_language(self, mock_load_model, client, sample_audio_file):
+        # Should accept all supported formats
+        assert response.status_code in [200, 500]  # 500 if Whisper fails on fake data
+
+    def test_transcribe_spanish_language(self, use_whisper, client):
         """Test transcription detects Spanish language"""
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {
-            "text": "Hola, esto es una prueba",
-            "language": "es"
-        }
-        mock_load_model.return_value = mock_model
+        use_whisper(_WHISPER_ES)
         
-        with open(sample_audio_file, 'rb') as f:
-            response = client.post(
-                "/api/voice/transcribe",
-                files={"file": ("test.mp3", f, "audio/mpeg")}
-            )
+        response = client.post(
+            "/api/voice/transcribe",
+            files={"file": ("test.mp3", FAKE_AUDIO, "audio/mpeg")}
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -156,22 +179,16 @@ class TestVoiceTranscription:
 class TestVoiceSynthesis:
     """Test TTS synthesis endpoint"""
 
-    @patch('app.api.voice.gTTS')
-    def test_synthesize_gtts_success(self, mock_gtts, client, temp_audio_dir):
+    def test_synthesize_gtts_success(self, client):
         """Test successful TTS with gTTS"""
-        # Mock gTTS
-        mock_tts_instance = MagicMock()
-        mock_gtts.return_value = mock_tts_instance
-        
-        with patch('app.api.voice.AUDIO_DIR', temp_audio_dir):
-            response = client.post(
-                "/api/voice/synthesize",
-                json={
-                    "text": "Hello world",
-                    "language": "en",
-                    "engine": "gtts"
-                }
-            )
+        response = client.post(
+            "/api/voice/synthesize",
+            json={
+                "text": "Hello world",
+                "language": "en",
+                "engine": "gtts"
+            }
+        )
         
         assert response.status_code == 200
         data = response.json()
@@ -180,24 +197,19 @@ class TestVoiceSynthesis:
         assert "audio_url" in data
         assert "/api/voice/audio/" in data["audio_url"]
 
-    @patch('app.api.voice.pyttsx3')
-    def test_synthesize_pyttsx3_success(self, mock_pyttsx3, client, temp_audio_dir):
+    def test_synthesize_pyttsx3_success(self, client):
         """Test successful TTS with pyttsx3"""
-        # Mock pyttsx3
-        mock_engine = MagicMock()
-        mock_pyttsx3.init.return_value = mock_engine
-        
-        with patch('app.api.voice.AUDIO_DIR', temp_audio_dir):
-            response = client.post(
-                "/api/voice/synthesize",
-                json={
-                    "text": "Hello world",
-                    "language": "en",
-                    "engine": "pyttsx3"
-                }
-            )
+        pytest.importorskip("pyttsx3")
+        response = client.post(
+            "/api/voice/synthesize",
+            json={
+                "text": "Hello world",
+                "language": "en",
+                "engine": "pyttsx3"
+            }
+        )
         
-        assert response.status_code in [200, 500]  # May fail if pyttsx3 not installed
+        assert response.status_code == 200
 
     def test_synthesize_empty_text(self, client):
         """Test synthesis with empty text"""
@@ -213,43 +225,28 @@ class TestVoiceSynthesis:
         # Should reject empty text
         assert response.status_code in [400, 422]
 
-    @patch('app.api.voice.gTTS')
-    def test_synthesize_spanish_text(self, mock_gtts, client, temp_audio_dir):
+    def test_synthesize_spanish_text(self, client):
         """Test synthesis with Spanish text"""
-        mock_tts_instance = MagicMock()
-        mock_gtts.return_value = mock_tts_instance
-        
-        with patch('app.api.voice.AUDIO_DIR', temp_audio_dir):
-            response = client.post(
-                "/api/voice/synthesize",
-                json={
-                    "text": "Hola mundo",
-                    "language": "es",
-                    "engine": "gtts"
-                }
-            )
+        response = client.post(
+            "/api/voice/synthesize",
+            json={
+                "text": "Hola mundo",
+                "language": "es",
+                "engine": "gtts"
+            }
+        )
         
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "success"
 
-    @patch('app.api.voice.gTTS')
-    def test_synthesize_long_text(self, mock_gtts, client, temp_audio_dir):
+    def test_synthesize_long_text(self, client):
         """Test synthesis with long text"""
-        mock_tts_instance = MagicMock()
-        mock_gtts.return_value = mock_tts_instance
-        
-        long_text = "This is a very long sentence. " * 50
-        
-        with patch('app.api.voice.AUDIO_DIR', temp_audio_dir):
-            response = client.post(
-                "/api/voice/synthesize",
-                json={
-                    "text": long_text,
-                    "language": "en",
-                    "engine": "gtts"
-                }
-            )
+        response = client.post(
+            "/api/voice/synthesize",
+            content=_LONG_PAYLOAD,
+            headers={"content-type": "application/json"}
+        )
         
         assert response.status_code == 200
 
@@ -291,10 +288,9 @@ class TestVoiceAudioServing:
         audio_filename = "test_audio.mp3"
         audio_path = os.path.join(temp_audio_dir, audio_filename)
         with open(audio_path, 'wb') as f:
-            f.write(b"fake audio data")
+            f.write(FAKE_AUDIO)
         
-        with patch('app.api.voice.AUDIO_DIR', temp_audio_dir):
-            response = client.get(f"/api/voice/audio/{audio_filename}")
+        response = client.get(f"/api/voice/audio/{audio_filename}")
         
         assert response.status_code == 200
         assert response.headers["content-type"] == "audio/mpeg"
@@ -311,62 +307,41 @@ class TestVoiceAudioServing:
         
         assert response.status_code == 404
 
-    def test_audio_serving_different_extensions(self, client, temp_audio_dir):
+    @pytest.mark.parametrize("ext", ["mp3", "wav", "ogg"])
+    def test_audio_serving_different_extensions(self, client, served_audio_files, ext):
         """Test serving different audio file extensions"""
-        extensions = ["mp3", "wav", "ogg"]
+        response = client.get(f"/api/voice/audio/test.{ext}")
         
-        for ext in extensions:
-            filename = f"test.{ext}"
-            audio_path = os.path.join(temp_audio_dir, filename)
-            with open(audio_path, 'wb') as f:
-                f.write(b"fake audio")
-            
-            with patch('app.api.voice.AUDIO_DIR', temp_audio_dir):
-                response = client.get(f"/api/voice/audio/{filename}")
-            
-            assert response.status_code == 200
+        assert response.status_code == 200
 
 
 class TestVoiceEdgeCases:
     """Test edge cases and error handling"""
 
-    @patch('app.api.voice.whisper.load_model')
-    def test_transcribe_corrupted_audio(self, mock_load_model, client, temp_audio_dir):
+    def test_transcribe_corrupted_audio(self, use_whisper, client):
         """Test transcription with corrupted audio file"""
-        mock_model = MagicMock()
-        mock_model.transcribe.side_effect = Exception("Failed to decode audio")
-        mock_load_model.return_value = mock_model
-        
-        corrupted_file = os.path.join(temp_audio_dir, "corrupted.mp3")
-        with open(corrupted_file, 'wb') as f:
-            f.write(b"not valid audio data")
+        use_whisper(_WHISPER_BROKEN)
         
-        with open(corrupted_file, 'rb') as f:
-            response = client.post(
-                "/api/voice/transcribe",
-                files={"file": ("corrupted.mp3", f, "audio/mpeg")}
-            )
+        response = client.post(
+            "/api/voice/transcribe",
+            files={"file": ("corrupted.mp3", b"not valid audio data", "audio/mpeg")}
+        )
         
         # Should handle error gracefully
         assert response.status_code in [400, 500]
         data = response.json()
         assert data["status"] == "error"
 
-    @patch('app.api.voice.gTTS')
-    def test_synthesize_special_characters(self, mock_gtts, client, temp_audio_dir):
+    def test_synthesize_special_characters(self, client):
         """Test synthesis with special characters"""
-        mock_tts_instance = MagicMock()
-        mock_gtts.return_value = mock_tts_instance
-        
-        with patch('app.api.voice.AUDIO_DIR', temp_audio_dir):
-            response = client.post(
-                "/api/voice/synthesize",
-                json={
-                    "text": "¡Hola! ¿Cómo estás? ñ á é í ó ú",
-                    "language": "es",
-                    "engine": "gtts"
-                }
-            )
+        response = client.post(
+            "/api/voice/synthesize",
+            json={
+                "text": "¡Hola! ¿Cómo estás? ñ á é í ó ú",
+                "language": "es",
+                "engine": "gtts"
+            }
+        )
         
         assert response.status_code == 200
 
@@ -384,25 +359,14 @@ class TestVoiceEdgeCases:
         # Should use default or reject
         assert response.status_code in [200, 422]
 
-    @patch('app.api.voice.whisper.load_model')
-    def test_transcribe_very_short_audio(self, mock_load_model, client, temp_audio_dir):
+    def test_transcribe_very_short_audio(self, use_whisper, client):
         """Test transcription with very short audio"""
-        mock_model = MagicMock()
-        mock_model.transcribe.return_value = {
-            "text": "",
-            "language": "en"
-        }
-        mock_load_model.return_value = mock_model
-        
-        short_audio = os.path.join(temp_audio_dir, "short.mp3")
-        with open(short_audio, 'wb') as f:
-            f.write(b"x" * 100)  # Very small file
+        use_whisper(_WHISPER_SILENT)
         
-        with open(short_audio, 'rb') as f:
-            response = client.post(
-                "/api/voice/transcribe",
-                files={"file": ("short.mp3", f, "audio/mpeg")}
-            )
+        response = client.post(
+            "/api/voice/transcribe",
+            files={"file": ("short.mp3", b"x" * 100, "audio/mpeg")}  # Very small file
+        )
         
         # Should handle gracefully
         assert response.status_code in [200, 400, 500]
@@ -42,9 +42,10 @@ def main():
         # Crop left area (assumes figure is on the left side of the original)
         box = (0, 0, crop_w, h)
         cropped = im.crop(box)
-        # Optionally resize to square avatar
+        # Optionally resize to square avatar; reducing_gap box-reduces large
+        # sources first so LANCZOS only filters a small intermediate image
         size = (512, 512)
-        cropped = cropped.resize(size, Image.LANCZOS)
+        cropped = cropped.resize(size, Image.LANCZOS, reducing_gap=3.0)
         cropped.save(out_path)
         print('Saved avatar to', out_path)
 
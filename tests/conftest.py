@@ -1,35 +1,63 @@
 """
 Pytest configuration and fixtures for ServiBot tests.
 """
+import json
+
 import pytest
 from fastapi.testclient import TestClient
-import sys
-import os
 
-# Make backend package importable (so `import app` works)
-# Add the `backend` directory to sys.path (project root + '/backend')
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-backend_path = os.path.join(project_root, 'backend')
-sys.path.insert(0, backend_path)
+# `backend/` is put on sys.path by pytest's `pythonpath` setting (pyproject.toml)
+from app.main import app
 
-from backend.app.main import app
 
+@pytest.fixture(scope="session")
+def _isolated_data_dirs(tmp_path_factory):
+    """Point uploads, the upload status file and ChromaDB at pytest temp dirs.
+    
+    The app lifespan auto-indexes UPLOAD_DIR into VECTOR_DB_PATH, so the
+    session client must never see the developer's ./data. tmp_path_factory
+    is per-worker under pytest-xdist, so workers do not share these either.
+    """
+    from app.core.config import settings
+    from app.db.chroma_client import reset_client
+    import app.api.upload as upload_api
+    
+    uploads_dir = tmp_path_factory.mktemp("uploads")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "UPLOAD_DIR", str(uploads_dir))
+        mp.setattr(settings, "VECTOR_DB_PATH", str(tmp_path_factory.mktemp("chroma")))
+        mp.setattr(upload_api, "UPLOAD_STATUS_FILE", str(uploads_dir.parent / "upload_status.json"))
+        reset_client()
+        yield
+    reset_client()
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app."""
-    return TestClient(app)
 
+@pytest.fixture(scope="session")
+def client(_isolated_data_dirs):
+    """Create one test client for the FastAPI app, shared across the session.
+    
+    Entered as a context manager so lifespan startup/shutdown runs once,
+    after the data directories are redirected to temp dirs.
+    """
+    with TestClient(app) as c:
+        yield c
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_chat_message():
-    """Sample chat message for testing."""
+    """Sample chat message for testing (treat as read-only)."""
     return {
         "message": "Help me organize my week",
         "conversation_id": "test_conv_123"
     }
 
 
+@pytest.fixture(scope="session")
+def sample_chat_body(sample_chat_message):
+    """sample_chat_message encoded once as a JSON request body."""
+    return json.dumps(sample_chat_message).encode()
+
+
 @pytest.fixture
 def sample_file_path(tmp_path):
     """Create a temporary test file."""
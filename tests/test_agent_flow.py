@@ -1,10 +1,4 @@
-from fastapi.testclient import TestClient
-from backend.app.main import app
-
-
-def test_chat_plan_execute_evaluate():
-    client = TestClient(app)
-
+def test_chat_plan_execute_evaluate(client):
     payload = {
         "message": "Por favor, crea una nota de prueba y envíame un recordatorio.",
         "context": {}
@@ -4,9 +4,13 @@ Tests for chat endpoint.
 import pytest
 
 
-def test_chat_endpoint(client, sample_chat_message):
+def test_chat_endpoint(client, sample_chat_message, sample_chat_body):
     """Test the chat endpoint with a sample message."""
-    response = client.post("/api/chat", json=sample_chat_message)
+    response = client.post(
+        "/api/chat",
+        content=sample_chat_body,
+        headers={"content-type": "application/json"}
+    )
     assert response.status_code == 200
     
     data = response.json()